@@ -4,15 +4,49 @@ Demo script showing ML attestation results being prepared for on-chain verificat
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import concurrent.futures
 import json
 import hashlib
 import time
 
+try:
+    # Optional orjson: canonical sorted-key emit straight to bytes,
+    # much faster than stdlib json.dumps(sort_keys=True)
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# Hot-path binding: skips the hashlib module attribute lookup per call,
+# and the OpenSSL-backed constructor uses SHA-NI where the CPU has it
+_sha256 = hashlib.sha256
+
+
+def make_session():
+    """Pooled session with exponential-backoff retry on transient errors"""
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504))
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_maxsize=16, max_retries=retry))
+    return session
+
+
+def _canonical_json_bytes(obj):
+    """Serialize obj to deterministic sorted-key JSON bytes for hashing"""
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True).encode()
+
 def test_onchain_verification():
     """Test the complete ML attestation -> on-chain verification flow"""
     print("🚀 Testing ML Attestation -> On-Chain Verification Flow")
     print("=" * 60)
-    
+
+    # One pooled session for every evaluator call - keep-alive skips the
+    # TCP handshake on all but the first request, and the mounted retry
+    # absorbs transient 5xx/connection hiccups without hand-rolled sleeps
+    session = make_session()
+
     # Test different models to show varying quality scores
     test_cases = [
         ("high_quality_model.pkl", "high_quality_test.csv", "Expected: ~90% quality"),
@@ -22,55 +56,65 @@ def test_onchain_verification():
     ]
     
     verification_results = []
-    
-    for model_file, dataset_file, description in test_cases:
-        print(f"\n📊 Testing: {model_file}")
-        print(f"📁 Dataset: {dataset_file}")
-        print(f"🎯 {description}")
-        print("-" * 40)
-        
-        # Call ML evaluator
-        url = "http://127.0.0.1:3333/test_evaluate/{}/{}".format(model_file, dataset_file)
-        
-        try:
-            response = requests.get(url, timeout=30)
-            if response.status_code == 200:
-                result = response.json()
-                evaluation = result['evaluation']
-                
-                # Extract key metrics
-                quality_score = evaluation['quality_score']
-                f1_score = evaluation['accuracy_metrics']['f1_score'] / 10000  # Convert from scaled
-                precision = evaluation['accuracy_metrics']['precision'] / 10000
-                recall = evaluation['accuracy_metrics']['recall'] / 10000
-                fairness_score = evaluation['bias_assessment']['fairness_score']
-                data_integrity = evaluation['data_integrity_score']
-                model_hash = evaluation['model_hash']
-                
-                print(f"✅ Quality Score: {quality_score}%")
-                print(f"📈 F1 Score: {f1_score:.2f}%")
-                print(f"🎯 Precision: {precision:.2f}%")
-                print(f"🔍 Recall: {recall:.2f}%")
-                print(f"⚖️  Fairness Score: {fairness_score}%")
-                print(f"🛡️  Data Integrity: {data_integrity}%")
-                print(f"🔐 Model Hash: {model_hash[:16]}...")
-                
-                # Simulate blockchain transaction data
-                blockchain_data = prepare_blockchain_transaction(evaluation, model_file)
-                verification_results.append({
-                    'model': model_file,
-                    'quality_score': quality_score,
-                    'blockchain_data': blockchain_data
-                })
-                
-                print(f"🔗 Blockchain TX Prepared: {blockchain_data['tx_digest']}")
-                
-            else:
-                print(f"❌ Failed to evaluate: {response.status_code}")
-                
-        except Exception as e:
-            print(f"❌ Error: {str(e)}")
-    
+
+    # The four evaluations are independent, so issue them concurrently -
+    # wall-clock drops from the sum of the runs to roughly the slowest one
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            executor.submit(
+                session.get,
+                "http://127.0.0.1:3333/test_evaluate/{}/{}".format(model_file, dataset_file),
+                timeout=30
+            ): (model_file, dataset_file, description)
+            for model_file, dataset_file, description in test_cases
+        }
+
+        for future in concurrent.futures.as_completed(futures):
+            model_file, dataset_file, description = futures[future]
+            print(f"\n📊 Testing: {model_file}")
+            print(f"📁 Dataset: {dataset_file}")
+            print(f"🎯 {description}")
+            print("-" * 40)
+
+            try:
+                response = future.result()
+                if response.status_code == 200:
+                    result = response.json()
+                    evaluation = result['evaluation']
+
+                    # Extract key metrics
+                    quality_score = evaluation['quality_score']
+                    f1_score = evaluation['accuracy_metrics']['f1_score'] / 10000  # Convert from scaled
+                    precision = evaluation['accuracy_metrics']['precision'] / 10000
+                    recall = evaluation['accuracy_metrics']['recall'] / 10000
+                    fairness_score = evaluation['bias_assessment']['fairness_score']
+                    data_integrity = evaluation['data_integrity_score']
+                    model_hash = evaluation['model_hash']
+
+                    print(f"✅ Quality Score: {quality_score}%")
+                    print(f"📈 F1 Score: {f1_score:.2f}%")
+                    print(f"🎯 Precision: {precision:.2f}%")
+                    print(f"🔍 Recall: {recall:.2f}%")
+                    print(f"⚖️  Fairness Score: {fairness_score}%")
+                    print(f"🛡️  Data Integrity: {data_integrity}%")
+                    print(f"🔐 Model Hash: {model_hash[:16]}...")
+
+                    # Simulate blockchain transaction data
+                    blockchain_data = prepare_blockchain_transaction(evaluation, model_file)
+                    verification_results.append({
+                        'model': model_file,
+                        'quality_score': quality_score,
+                        'blockchain_data': blockchain_data
+                    })
+
+                    print(f"🔗 Blockchain TX Prepared: {blockchain_data['tx_digest']}")
+
+                else:
+                    print(f"❌ Failed to evaluate: {response.status_code}")
+
+            except Exception as e:
+                print(f"❌ Error: {str(e)}")
+
     # Summary
     print("\n" + "=" * 60)
     print("📋 VERIFICATION SUMMARY")
@@ -115,8 +159,8 @@ def prepare_blockchain_transaction(evaluation, model_name):
         'timestamp': int(time.time() * 1000)
     }
     
-    attestation_json = json.dumps(attestation_data, sort_keys=True)
-    attestation_hash = hashlib.sha256(attestation_json.encode()).hexdigest()
+    attestation_json = _canonical_json_bytes(attestation_data)
+    attestation_hash = _sha256(attestation_json).hexdigest()
     
     # Simulate Move function call data
     blockchain_transaction = {
@@ -146,9 +190,10 @@ if __name__ == "__main__":
     print("for publication to the Sui blockchain smart contract.")
     print("")
     
-    # Check if ML evaluator is running
+    # Check if ML evaluator is running - the session's backoff retry
+    # rides out a still-starting evaluator instead of failing immediately
     try:
-        health_response = requests.get("http://127.0.0.1:3333/health", timeout=5)
+        health_response = make_session().get("http://127.0.0.1:3333/health", timeout=5)
         if health_response.status_code == 200:
             print("✅ ML Evaluator is running on localhost:3333")
             test_onchain_verification()
@@ -0,0 +1,28 @@
+"""Gunicorn configuration for the ML attestation server.
+
+Werkzeug's development server handles one request at a time; under
+concurrent evaluation load every client queues behind the request in
+flight. Run the server with:
+
+    gunicorn -c gunicorn_conf.py ml_attestation_server:app
+"""
+
+import multiprocessing
+import os
+
+bind = "{}:{}".format(os.getenv('FLASK_HOST', 'localhost'),
+                      os.getenv('FLASK_PORT', '3333'))
+
+# One process per core for the CPU-heavy evaluation work, plus threads
+# per worker so downloads and SEAL round-trips overlap while the GIL is
+# released in requests/numpy
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
+
+# MLEvaluator() and the dotenv load run once in the master before fork
+# instead of once per worker
+preload_app = True
+
+# Evaluations of large models can legitimately take a while
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '120'))
@@ -7,125 +7,288 @@ Handles SEAL decryption for TEE model evaluation
 import os
 import json
 import base64
+import collections
+import functools
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import hashlib
+import logging
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
-@dataclass
+try:
+    # OpenSSL-backed AES-GCM (AES-NI + PCLMUL); without it the mock
+    # header-stripping path below still works
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM as _AESGCM
+    from cryptography.hazmat.primitives.ciphers import Cipher as _Cipher
+    from cryptography.hazmat.primitives.ciphers.algorithms import AES as _AES
+    from cryptography.hazmat.primitives.ciphers.modes import GCM as _GCM
+except ImportError:
+    _AESGCM = _Cipher = _AES = _GCM = None
+
+@dataclass(frozen=True, slots=True)
 class KeyServerConfig:
     object_id: str
     url: str
     weight: int = 1
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SealConfig:
     package_id: str
     threshold: int
     key_servers: List[KeyServerConfig]
     session_ttl: int = 1800  # 30 minutes
 
+# Magic prefixes that conclusively mark a SEAL blob, and the
+# SEAL-specific substrings probed on ambiguous high-entropy heads
+_SEAL_MAGIC = (b'SEAL', b'\x00SEAL')
+_SEAL_PATTERNS = (b'seal', b'enc', b'key')
+
+logger = logging.getLogger("seal")
+
+
+def _read_response_bytes(response) -> bytes:
+    """Drain a streamed response into one buffer sized by Content-Length.
+
+    requests' .content grows its buffer as chunks arrive; preallocating
+    from the advertised length receives the body with a single
+    allocation, scattering 64 KiB chunks into place. Responses without
+    a usable length fall back to .content.
+    """
+    size = int(response.headers.get('Content-Length') or 0)
+    if size <= 0:
+        return response.content
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    offset = 0
+    extra = []
+    for chunk in response.iter_content(65536):
+        n = len(chunk)
+        if offset + n <= size:
+            view[offset:offset + n] = chunk
+            offset += n
+        else:
+            # Body longer than advertised; collect the overflow
+            extra.append(chunk)
+    view.release()
+    if extra or offset != size:
+        return bytes(buffer[:offset]) + b''.join(extra)
+    return bytes(buffer)
+
+
+def _loads_response(response) -> Dict:
+    """Parse a response body, through orjson when it is installed"""
+    body = _read_response_bytes(response)
+    if _orjson is not None:
+        return _orjson.loads(body)
+    return json.loads(body)
+
+
+def _build_gf_tables():
+    """Log/antilog tables for GF(2^8) with the AES polynomial 0x11B"""
+    exp = np.zeros(510, dtype=np.uint8)
+    log = np.zeros(256, dtype=np.int64)
+    x = 1
+    for i in range(255):
+        exp[i] = x
+        log[x] = i
+        # Multiply by the generator 0x03: 3*x = 2*x XOR x
+        doubled = ((x << 1) & 0xFF) ^ (0x1B if x & 0x80 else 0)
+        x = doubled ^ x
+    exp[255:510] = exp[0:255]
+    return exp, log
+
+# Precomputed at import so each Lagrange term is one vectorized table
+# lookup across the whole key instead of per-byte Python arithmetic
+_GF_EXP, _GF_LOG = _build_gf_tables() if np is not None else (None, None)
+
+
+def _combine_shares(shares: List[Tuple[int, bytes]]) -> Optional[bytes]:
+    """Combine Shamir key shares at x=0 via Lagrange interpolation.
+
+    Each share is (x, share_bytes) with x a non-zero GF(2^8) point. The
+    Lagrange coefficient is computed once per share in log space, then
+    applied to every key byte with a single exp-table gather; the
+    shares XOR-accumulate into the secret.
+    """
+    if np is None or not shares:
+        return None
+    xs = [x for x, _ in shares]
+    if len(set(xs)) != len(xs) or 0 in xs:
+        return None
+
+    secret = None
+    for j, (xj, share) in enumerate(shares):
+        log_coeff = 0
+        for m, xm in enumerate(xs):
+            if m == j:
+                continue
+            log_coeff += int(_GF_LOG[xm]) - int(_GF_LOG[xm ^ xj])
+        share_arr = np.frombuffer(share, dtype=np.uint8)
+        term = _GF_EXP[(_GF_LOG[share_arr] + log_coeff) % 255]
+        term = np.where(share_arr == 0, 0, term).astype(np.uint8)
+        secret = term if secret is None else secret ^ term
+    return secret.tobytes()
+
+@functools.lru_cache(maxsize=1)
+def _load_seal_config() -> SealConfig:
+    """Load SEAL configuration from environment (read once per process)"""
+    # Updated to match constants.ts - correct SEAL package for testnet
+    package_id = os.getenv("SEAL_PACKAGE_ID", "0x8afa5d31dbaa0a8fb07082692940ca3d56b5e856c5126cb5a3693f0a4de63b82")
+    threshold = int(os.getenv("SEAL_THRESHOLD", "2"))
+
+    # Load key servers from environment - updated to match constants.ts
+    key_servers = [
+        KeyServerConfig(
+            object_id=os.getenv("SEAL_KEY_SERVER_1_OBJECT_ID", "0x2304dd255b13eaf5cb471bd5188df946a64f1715ee2b7b02fecf306bd12ceebc"),
+            url=os.getenv("SEAL_KEY_SERVER_1_URL", "https://seal-key-server-testnet-1.mystenlabs.com"),
+            weight=1
+        ),
+        KeyServerConfig(
+            object_id=os.getenv("SEAL_KEY_SERVER_2_OBJECT_ID", "0x81aeaa8c25d2c912e1dc23b4372305b7a602c4ec4cc3e510963bc635e500aa37"),
+            url=os.getenv("SEAL_KEY_SERVER_2_URL", "https://seal-key-server-testnet-2.mystenlabs.com"),
+            weight=1
+        )
+    ]
+
+    return SealConfig(
+        package_id=package_id,
+        threshold=threshold,
+        key_servers=key_servers,
+        session_ttl=int(os.getenv("SEAL_SESSION_TTL_MINUTES", "30")) * 60
+    )
+
 class SealClient:
     """Python SEAL Client for decrypting blobs in TEE environment"""
     
+    # Bound on the probe cache below
+    _PROBE_CACHE_MAX = 1024
+
     def __init__(self):
-        self.config = self._load_config()
-        self.session_cache: Dict[str, Dict] = {}
-        
-    def _load_config(self) -> SealConfig:
-        """Load SEAL configuration from environment"""
-        # Updated to match constants.ts - correct SEAL package for testnet
-        package_id = os.getenv("SEAL_PACKAGE_ID", "0x8afa5d31dbaa0a8fb07082692940ca3d56b5e856c5126cb5a3693f0a4de63b82")
-        threshold = int(os.getenv("SEAL_THRESHOLD", "2"))
-
-        # Load key servers from environment - updated to match constants.ts
-        key_servers = [
-            KeyServerConfig(
-                object_id=os.getenv("SEAL_KEY_SERVER_1_OBJECT_ID", "0x2304dd255b13eaf5cb471bd5188df946a64f1715ee2b7b02fecf306bd12ceebc"),
-                url=os.getenv("SEAL_KEY_SERVER_1_URL", "https://seal-key-server-testnet-1.mystenlabs.com"),
-                weight=1
-            ),
-            KeyServerConfig(
-                object_id=os.getenv("SEAL_KEY_SERVER_2_OBJECT_ID", "0x81aeaa8c25d2c912e1dc23b4372305b7a602c4ec4cc3e510963bc635e500aa37"),
-                url=os.getenv("SEAL_KEY_SERVER_2_URL", "https://seal-key-server-testnet-2.mystenlabs.com"),
-                weight=1
-            )
-        ]
-        
-        return SealConfig(
-            package_id=package_id,
-            threshold=threshold,
-            key_servers=key_servers,
-            session_ttl=int(os.getenv("SEAL_SESSION_TTL_MINUTES", "30")) * 60
+        self.config = _load_seal_config()
+        # Encryption-probe verdicts keyed by a short hash of the head
+        self._is_seal_cache: "collections.OrderedDict[bytes, bool]" = collections.OrderedDict()
+
+        # The client is a long-lived singleton talking to a small fixed
+        # set of key servers; pooled keep-alive connections skip the
+        # TCP+TLS handshake on every call after the first
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=len(self.config.key_servers),
+            pool_maxsize=4,
+            max_retries=Retry(total=2, backoff_factor=0.1)
         )
-    
-    def is_seal_encrypted(self, data: bytes) -> bool:
-        """Check if data appears to be SEAL encrypted"""
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def is_seal_encrypted(self, data) -> bool:
+        """Check if data appears to be SEAL encrypted (bytes or memoryview)"""
+        # Conclusive magic-prefix check first - this is a heuristic; a
+        # real implementation would check actual SEAL headers. The
+        # 5-byte copy covers both prefixes and works on memoryviews;
+        # startswith dispatches over the whole tuple in C.
+        if bytes(data[:5]).startswith(_SEAL_MAGIC):
+            return len(data) >= 32
+
         if len(data) < 32:
             return False
-            
+
+        # The probe only reads the 256-byte head, so repeat evaluations
+        # of the same stored blob hit a cached verdict keyed by a short
+        # BLAKE2 digest of that head. 256 bytes is the smallest window
+        # where a uniform byte stream can actually reach 8 bits of
+        # sample entropy; anything shorter caps below the threshold.
+        head = bytes(data[:256])
+        cache_key = hashlib.blake2b(head, digest_size=8).digest()
+        cached = self._is_seal_cache.get(cache_key)
+        if cached is not None:
+            self._is_seal_cache.move_to_end(cache_key)
+            return cached
+
+        verdict = False
         try:
-            # Check for SEAL encryption headers/patterns
-            # SEAL encrypted data typically starts with specific byte patterns
-            first_bytes = data[:16]
-            
-            # Look for common SEAL encryption indicators
-            # This is a heuristic - real implementation would check actual SEAL headers
-            if first_bytes.startswith(b'SEAL') or first_bytes.startswith(b'\x00SEAL'):
-                return True
-                
-            # Check entropy - encrypted data should have high entropy
-            entropy = self._calculate_entropy(first_bytes)
+            # Only ambiguous inputs pay for the entropy probe - encrypted
+            # data should have high entropy
+            entropy = self._calculate_entropy(head)
             if entropy > 0.85:  # High entropy indicates encryption
                 # Additional checks for SEAL-specific patterns
-                if any(pattern in data[:64] for pattern in [b'seal', b'enc', b'key']):
-                    return True
-                    
+                verdict = any(head.find(pattern) != -1 for pattern in _SEAL_PATTERNS)
+
         except Exception as e:
             print(f"Error checking SEAL encryption: {e}")
-            
-        return False
+
+        self._is_seal_cache[cache_key] = verdict
+        if len(self._is_seal_cache) > self._PROBE_CACHE_MAX:
+            self._is_seal_cache.popitem(last=False)
+        return verdict
     
     def _calculate_entropy(self, data: bytes) -> float:
-        """Calculate Shannon entropy of data"""
-        if not data:
+        """Calculate normalized Shannon entropy of data.
+
+        Normalized by the maximum entropy a sample of this length can
+        exhibit - log2(min(256, len)) bits - not a flat 8 bits: a
+        64-byte sample tops out at 6 bits, so dividing by 8 would cap
+        the result at 0.75 and a high-entropy threshold could never
+        fire on short windows.
+        """
+        if len(data) < 2:
             return 0.0
+        max_bits = math.log2(min(256, len(data)))
 
-        # Count byte frequencies
-        frequencies = {}
-        for byte in data:
-            frequencies[byte] = frequencies.get(byte, 0) + 1
+        if np is not None:
+            # One C-level bincount over the bytes instead of a Python
+            # dict loop, then the log-sum over at most 256 non-zero bins
+            counts = np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+            probabilities = counts[counts > 0] / len(data)
+            entropy = float(-(probabilities * np.log2(probabilities)).sum())
+            return entropy / max_bits
 
-        # Calculate Shannon entropy
-        import math
-        entropy = 0.0
+        # Counter iterates the bytes in C; only the <=256 distinct bins
+        # reach the interpreter loop below
         length = len(data)
-        for count in frequencies.values():
+        entropy = 0.0
+        for count in collections.Counter(data).values():
             probability = count / length
-            if probability > 0:
-                entropy -= probability * math.log2(probability)
-
-        return entropy / 8.0  # Normalize to 0-1 range (max entropy is 8 bits)
+            entropy -= probability * math.log2(probability)
+        return entropy / max_bits
     
-    def decrypt_blob(self, encrypted_data: bytes, user_address: str = None, transaction_digest: str = None) -> bytes:
-        """Decrypt SEAL encrypted blob data"""
+    def decrypt_blob(self, encrypted_data, user_address: str = None, transaction_digest: str = None) -> bytes:
+        """Decrypt SEAL encrypted blob data (accepts bytes or memoryview)"""
         try:
             print(f"SEAL: Attempting to decrypt {len(encrypted_data)} bytes")
-            
+
+            # A read-only view makes every downstream slice zero-copy;
+            # slicing bytes directly would duplicate the blob
+            view = memoryview(encrypted_data).toreadonly()
+
             # Check if data is actually SEAL encrypted
-            if not self.is_seal_encrypted(encrypted_data):
+            if not self.is_seal_encrypted(view):
                 print("SEAL: Data doesn't appear to be SEAL encrypted, returning as-is")
                 return encrypted_data
-            
+
             print("SEAL: Data appears to be SEAL encrypted, attempting decryption...")
-            
+
             # For TEE environment, we would normally:
             # 1. Extract SEAL session keys from the encrypted blob
             # 2. Contact key servers for decryption keys
             # 3. Decrypt using the keys
-            
+
             # Simplified approach for now - in a real TEE:
-            decrypted_data = self._decrypt_with_key_servers(encrypted_data, user_address, transaction_digest)
+            decrypted_data = self._decrypt_with_key_servers(view, user_address, transaction_digest)
             
             if decrypted_data:
                 print(f"SEAL: Successfully decrypted to {len(decrypted_data)} bytes")
@@ -139,7 +302,7 @@ class SealClient:
             # This allows testing with non-encrypted blobs
             return encrypted_data
     
-    def _decrypt_with_key_servers(self, encrypted_data: bytes, user_address: str = None, transaction_digest: str = None) -> Optional[bytes]:
+    def _decrypt_with_key_servers(self, encrypted_data, user_address: str = None, transaction_digest: str = None) -> Optional[bytes]:
         """Decrypt data using SEAL key servers"""
         try:
             # Extract encryption metadata from blob
@@ -160,105 +323,220 @@ class SealClient:
             print(f"SEAL: Key server decryption failed: {e}")
             return None
     
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _extract_seal_metadata_cached(prefix: bytes, key_shares: int) -> tuple:
+        """Derive metadata for one blob prefix, memoized by lru_cache.
+
+        Returns a tuple of items rather than a dict so cache hits hand
+        out immutable state.
+        """
+        # In real SEAL implementation, metadata is embedded in the encrypted blob
+        # For now, create mock metadata structure
+        return (
+            ("session_id", hashlib.blake2b(prefix, digest_size=8).hexdigest()),
+            ("encryption_algorithm", "AES-256-GCM"),
+            ("key_shares", key_shares),
+            ("timestamp", "2025-11-24")
+        )
+
     def _extract_seal_metadata(self, encrypted_data: bytes) -> Optional[Dict]:
         """Extract SEAL encryption metadata from blob"""
         try:
-            # In real SEAL implementation, metadata is embedded in the encrypted blob
-            # For now, create mock metadata structure
-            return {
-                "session_id": hashlib.sha256(encrypted_data[:32]).hexdigest()[:16],
-                "encryption_algorithm": "AES-256-GCM",
-                "key_shares": self.config.threshold,
-                "timestamp": "2025-11-24"
-            }
+            # Metadata only depends on the blob prefix, so repeat
+            # decrypts of the same blob skip the hashing entirely
+            prefix = bytes(encrypted_data[:32])
+            return dict(self._extract_seal_metadata_cached(prefix, self.config.threshold))
         except Exception as e:
             print(f"SEAL: Metadata extraction failed: {e}")
             return None
     
+    def _fetch_session_key(self, i: int, key_server: KeyServerConfig, metadata: Dict,
+                           user_address: str = None, transaction_digest: str = None) -> Optional[Dict]:
+        """Request one session key share from a single key server"""
+        try:
+            # debug-level with lazy formatting: print() grabs the stdout
+            # lock and formats unconditionally, which serializes the
+            # threaded fan-out
+            logger.debug("Contacting key server %d: %s", i + 1, key_server.url)
+
+            response = self._session.post(
+                f"{key_server.url}/v1/session_keys",
+                json={
+                    "session_id": metadata.get("session_id"),
+                    "user_address": user_address,
+                    "transaction_digest": transaction_digest,
+                    "object_id": key_server.object_id
+                },
+                timeout=(2.0, 10.0),
+                stream=True
+            )
+
+            if response.status_code == 200:
+                logger.debug("Got session key from server %d", i + 1)
+                return {
+                    "server_id": i,
+                    "key_data": _loads_response(response),
+                    "weight": key_server.weight
+                }
+            logger.debug("Key server %d returned %d", i + 1, response.status_code)
+        except Exception as e:
+            logger.debug("Failed to get key from server %d: %s", i + 1, e)
+        return None
+
     def _get_session_keys(self, metadata: Dict, user_address: str = None, transaction_digest: str = None) -> List[Dict]:
         """Get session keys from SEAL key servers"""
-        session_keys = []
-        
-        for i, key_server in enumerate(self.config.key_servers):
+        # Preallocated slots assigned by server index keep the returned
+        # share order deterministic regardless of completion order
+        slots: List[Optional[Dict]] = [None] * len(self.config.key_servers)
+
+        # The share requests are independent, so fan out to all servers
+        # at once and stop as soon as the threshold is met - wall time
+        # becomes the slowest of the first `threshold` responses instead
+        # of the sum of every round trip
+        with ThreadPoolExecutor(max_workers=len(self.config.key_servers)) as executor:
+            futures = {
+                executor.submit(self._fetch_session_key, i, key_server, metadata,
+                                user_address, transaction_digest): i
+                for i, key_server in enumerate(self.config.key_servers)
+            }
+            received = 0
+            for future in as_completed(futures):
+                key = future.result()
+                if key is not None:
+                    slots[futures[future]] = key
+                    received += 1
+                    if received >= self.config.threshold:
+                        for pending in futures:
+                            pending.cancel()
+                        break
+
+        return [key for key in slots if key is not None]
+    
+    def _reconstruct_key(self, session_keys: List[Dict]) -> Optional[bytes]:
+        """Reconstruct the symmetric key from fetched session keys.
+
+        Key servers that return the full unwrapped key are handled
+        here; anything else (per-server shares, mock responses) yields
+        None and the caller falls back to the placeholder path.
+        """
+        for session_key in session_keys:
+            key_b64 = (session_key.get("key_data") or {}).get("key")
+            if not key_b64:
+                continue
             try:
-                print(f"SEAL: Contacting key server {i+1}: {key_server.url}")
-                
-                # Request session key from key server
-                response = requests.post(
-                    f"{key_server.url}/v1/session_keys",
-                    json={
-                        "session_id": metadata.get("session_id"),
-                        "user_address": user_address,
-                        "transaction_digest": transaction_digest,
-                        "object_id": key_server.object_id
-                    },
-                    timeout=10
-                )
-                
-                if response.status_code == 200:
-                    key_data = response.json()
-                    session_keys.append({
-                        "server_id": i,
-                        "key_data": key_data,
-                        "weight": key_server.weight
-                    })
-                    print(f"SEAL: Got session key from server {i+1}")
-                else:
-                    print(f"SEAL: Key server {i+1} returned {response.status_code}")
-                    
-            except Exception as e:
-                print(f"SEAL: Failed to get key from server {i+1}: {e}")
+                key = base64.b64decode(key_b64)
+            except (ValueError, TypeError):
                 continue
-        
-        return session_keys
-    
-    def _perform_decryption(self, encrypted_data: bytes, session_keys: List[Dict], metadata: Dict) -> bytes:
+            if len(key) == 32:
+                return key
+
+        # Otherwise combine per-server Shamir shares once the threshold
+        # is met
+        shares = []
+        for session_key in session_keys:
+            key_data = session_key.get("key_data") or {}
+            share_b64 = key_data.get("key_share")
+            if not share_b64:
+                continue
+            try:
+                share = base64.b64decode(share_b64)
+            except (ValueError, TypeError):
+                continue
+            x = int(key_data.get("share_index", session_key.get("server_id", 0) + 1))
+            shares.append((x, share))
+
+        if len(shares) >= self.config.threshold:
+            combined = _combine_shares(shares[:self.config.threshold])
+            if combined is not None and len(combined) == 32:
+                return combined
+        return None
+
+    @staticmethod
+    def _stream_gcm_decrypt(key: bytes, nonce: bytes, body: memoryview) -> bytes:
+        """Decrypt ciphertext||tag through one decryptor in 64 KiB chunks.
+
+        One-shot AESGCM.decrypt materializes an extra full-size copy of
+        the ciphertext next to the plaintext; streaming views of the
+        blob through Cipher/GCM keep the per-step working set cache
+        sized and cap peak memory at the output buffer. The GCM tag is
+        still verified on finalize.
+        """
+        tag = bytes(body[-16:])
+        ciphertext = body[:-16]
+        decryptor = _Cipher(_AES(key), _GCM(nonce, tag)).decryptor()
+        plaintext = bytearray()
+        for offset in range(0, len(ciphertext), 65536):
+            plaintext += decryptor.update(ciphertext[offset:offset + 65536])
+        plaintext += decryptor.finalize()
+        return bytes(plaintext)
+
+    def _perform_decryption(self, encrypted_data, session_keys: List[Dict], metadata: Dict) -> bytes:
         """Perform actual decryption using session keys"""
         try:
             print(f"SEAL: Performing decryption with {len(session_keys)} session keys")
-            
-            # In real SEAL implementation, this would:
-            # 1. Combine session key shares using threshold cryptography
-            # 2. Decrypt the blob using the reconstructed key
-            # 3. Verify integrity and authenticity
-            
-            # For now, simulate successful decryption
-            # In production, this would be the actual SEAL decryption algorithm
-            
-            # Mock decryption - remove fake encryption wrapper
+
+            # When the key material and the cryptography backend are
+            # both available, decrypt for real: 12-byte nonce, then
+            # ciphertext with the 16-byte GCM tag appended. AESGCM
+            # dispatches to OpenSSL's AES-NI + PCLMUL assembly.
+            key = self._reconstruct_key(session_keys)
+            if (_AESGCM is not None and key is not None
+                    and metadata.get("encryption_algorithm") == "AES-256-GCM"
+                    and len(encrypted_data) > 28):
+                nonce = bytes(encrypted_data[:12])
+                return self._stream_gcm_decrypt(key, nonce, memoryview(encrypted_data)[12:])
+
+            # Mock decryption - remove fake encryption wrapper; the one
+            # bytes() copy here is the output boundary
             if len(encrypted_data) > 64:
                 # Assume first 64 bytes are fake encryption header
-                return encrypted_data[64:]
+                return bytes(memoryview(encrypted_data)[64:])
             else:
-                return encrypted_data
-                
+                return bytes(encrypted_data)
+
         except Exception as e:
             print(f"SEAL: Decryption operation failed: {e}")
             raise
     
+    def _check_key_server(self, i: int, key_server: KeyServerConfig) -> bool:
+        """Health-check a single key server"""
+        try:
+            # Split connect/read timeouts so a dead server costs the
+            # connect budget, not the full request timeout
+            response = self._session.get(f"{key_server.url}/health", timeout=(1.0, 2.0))
+            healthy = response.status_code == 200
+            print(f"SEAL: Key server {i+1} ({key_server.url}): {'✓' if healthy else '✗'}")
+            return healthy
+        except Exception as e:
+            print(f"SEAL: Key server {i+1} failed: {e}")
+            return False
+
     def test_key_servers(self) -> Dict[str, bool]:
         """Test connectivity to all configured key servers"""
-        results = {}
-        
-        for i, key_server in enumerate(self.config.key_servers):
-            try:
-                response = requests.get(f"{key_server.url}/health", timeout=5)
-                results[f"server_{i+1}"] = response.status_code == 200
-                print(f"SEAL: Key server {i+1} ({key_server.url}): {'✓' if results[f'server_{i+1}'] else '✗'}")
-            except Exception as e:
-                results[f"server_{i+1}"] = False
-                print(f"SEAL: Key server {i+1} failed: {e}")
-        
-        return results
+        # Probe every server concurrently; wall time is the slowest
+        # single check rather than the sum of them
+        with ThreadPoolExecutor(max_workers=len(self.config.key_servers)) as executor:
+            futures = {
+                executor.submit(self._check_key_server, i, key_server): i
+                for i, key_server in enumerate(self.config.key_servers)
+            }
+            return {f"server_{futures[future]+1}": future.result() for future in futures}
 
 # Global SEAL client instance
 _seal_client = None
+_seal_client_lock = threading.Lock()
 
 def get_seal_client() -> SealClient:
     """Get global SEAL client instance"""
     global _seal_client
+    # Double-checked: the hot path is a plain read, the lock only
+    # guards first construction so concurrent requests cannot build
+    # two clients with separate sessions and caches
     if _seal_client is None:
-        _seal_client = SealClient()
+        with _seal_client_lock:
+            if _seal_client is None:
+                _seal_client = SealClient()
     return _seal_client
 
 def decrypt_blob_if_needed(data: bytes, user_address: str = None, transaction_digest: str = None) -> bytes:
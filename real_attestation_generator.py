@@ -0,0 +1,664 @@
+#!/usr/bin/env python3
+"""
+Real Attestation Generator for Satya Marketplace
+Generates simulation-mode TEE attestations backed by real model file hashes,
+real model-derived quality scores and PCR-style system measurements.
+"""
+
+import os
+import sys
+import json
+import logging
+import time
+import functools
+import hashlib
+import hmac
+import io
+import mmap
+import pickle
+import pickletools
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+_PCR_CACHE_FILE = Path.home() / ".cache" / "satya" / "pcr.json"
+
+# platform.system()/node()/machine() re-probe the OS on every call (regex
+# over uname output, /proc reads); os.uname() is a single cheap syscall,
+# and none of these values change within a process - read them once
+if hasattr(os, 'uname'):
+    _UNAME = os.uname()
+    _OS_NAME, _NODE_NAME = _UNAME.sysname, _UNAME.nodename
+    _OS_RELEASE, _MACHINE = _UNAME.release, _UNAME.machine
+else:  # non-POSIX fallback
+    import platform
+    _OS_NAME, _NODE_NAME = platform.system(), platform.node()
+    _OS_RELEASE, _MACHINE = platform.release(), platform.machine()
+
+# Per-attestation status lines are debug-level: formatting + a stdout
+# write per call is measurable in bulk runs and serializes pool workers
+# on the shared pipe
+logger = logging.getLogger(__name__)
+
+
+try:
+    # Optional Intel ISA-L multi-buffer SHA-256: interleaves independent
+    # message schedules across SIMD lanes, a large win for many small files
+    from isal_crypto import sha256_multi_buffer as _sha256_multi_buffer
+except ImportError:
+    _sha256_multi_buffer = None
+
+_SHA256_BATCH_LANES = 8
+
+try:
+    # Optional orjson: SIMD-accelerated encoder that returns bytes directly,
+    # skipping the str build + encode of the stdlib path
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _json_dumps(obj, indent=False):
+    """Serialize to JSON bytes, via orjson when installed"""
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def _json_loads(data):
+    """Parse JSON bytes/str, via orjson when installed"""
+    return _orjson.loads(data) if _orjson is not None else json.loads(data)
+
+
+def _sha256_files_batch(paths):
+    """Hash many files, feeding the multi-buffer backend when available.
+
+    Returns {path: hex_digest}. Falls back to sequential streamed hashing
+    when no SIMD multi-buffer implementation is installed.
+    """
+    digests = {}
+    paths = list(paths)
+    if _sha256_multi_buffer is not None:
+        for start in range(0, len(paths), _SHA256_BATCH_LANES):
+            lane_paths = paths[start:start + _SHA256_BATCH_LANES]
+            buffers = []
+            for path in lane_paths:
+                with open(path, 'rb') as f:
+                    buffers.append(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            try:
+                for path, digest in zip(lane_paths, _sha256_multi_buffer(buffers)):
+                    digests[path] = digest.hex()
+            finally:
+                for buf in buffers:
+                    buf.close()
+    else:
+        for path in paths:
+            digests[path] = _sha256_file(path)
+    return digests
+
+
+def _pick_sha256():
+    """Bind the faster SHA-256 backend for bulk file hashing.
+
+    hashlib (OpenSSL) nearly always wins on SHA-NI hardware, but on builds
+    without hardware SHA PyCryptodome's implementation can be faster; a
+    one-off 1 MiB probe at import settles it. Small-message PCR hashing
+    stays on hashlib, where constructor overhead dominates.
+    """
+    try:
+        from Cryptodome.Hash import SHA256 as _pc_sha256
+    except ImportError:
+        return hashlib.sha256
+    probe = b'\x00' * (1 << 20)
+    t0 = time.perf_counter()
+    hashlib.sha256(probe).digest()
+    t_hashlib = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    _pc_sha256.new(probe).digest()
+    t_pc = time.perf_counter() - t0
+    return hashlib.sha256 if t_hashlib <= t_pc else _pc_sha256.new
+
+
+_sha256 = _pick_sha256()
+
+
+def _sha256_file(path):
+    """Streamed SHA-256 of one file in O(1) memory"""
+    with open(path, 'rb') as f:
+        if _sha256 is hashlib.sha256 and hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()  # Python 3.11+
+        # mmap + chunked update keeps memory flat and lets kernel
+        # readahead overlap with hashing
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            h = _sha256()
+            for i in range(0, len(mm), 1 << 20):
+                h.update(mm[i:i + (1 << 20)])
+            return h.hexdigest()
+
+
+try:
+    # Optional BLAKE3: ~2.5x faster than SHA-256 even with SHA-NI, and its
+    # tree structure parallelizes across cores on large inputs
+    import blake3 as _blake3
+    def _fast_hasher():
+        return _blake3.blake3()
+except ImportError:
+    def _fast_hasher():
+        return hashlib.blake2b(digest_size=32)
+
+
+def _update_fields(h, parts):
+    """Feed length-prefixed byte fields into an existing hasher"""
+    for p in parts:
+        if isinstance(p, str):
+            p = p.encode()
+        h.update(len(p).to_bytes(4, 'little'))
+        h.update(p)
+
+
+def _pack_fields(parts):
+    """Length-prefixed field encoding as one bytes object.
+
+    Produces exactly the stream _update_fields would feed a hasher, for
+    backends that want whole messages rather than incremental updates.
+    """
+    out = bytearray()
+    for p in parts:
+        if isinstance(p, str):
+            p = p.encode()
+        out += len(p).to_bytes(4, 'little')
+        out += p
+    return bytes(out)
+
+
+def _h(*parts, new=hashlib.sha256):
+    """Hash length-prefixed byte fields with a single incremental hasher.
+
+    Field order is fixed by the caller, so the digest stays canonical
+    without any JSON serialization or key sorting.
+    """
+    h = new()
+    _update_fields(h, parts)
+    return h.digest()
+
+
+def _fast_h(*parts):
+    """_h over BLAKE3/BLAKE2b, for digests that never leave this process"""
+    return _h(*parts, new=_fast_hasher)
+
+
+def _stat_key(path):
+    """(inode, mtime, size, path) - cheap freshness key for per-file caches"""
+    st = os.stat(path)
+    return st.st_ino, st.st_mtime_ns, st.st_size, str(path)
+
+
+@functools.lru_cache(maxsize=256)
+def _hash_from_stat(inode, mtime_ns, size, path):
+    """Content hash, cached until the file's stat signature changes"""
+    return _sha256_file(path)
+
+
+_PICKLE_STR_OPS = ('SHORT_BINUNICODE', 'BINUNICODE', 'UNICODE')
+_PICKLE_INT_OPS = ('BININT', 'BININT1', 'BININT2', 'LONG1', 'INT')
+
+
+def _open_buffer(path):
+    """Single open()/close() per model ingest.
+
+    Returns the file contents as a zero-copy mmap view, or plain bytes for
+    empty files and platforms without mmap.
+    """
+    with open(path, 'rb') as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            return f.read()
+
+
+def _load_once(path):
+    """Read a model file once, returning (buffer, sha256_hex).
+
+    The buffer is an mmap view where possible, so hashing and the quality
+    inspection share one pass over the file instead of one read each.
+    """
+    buf = _open_buffer(path)
+    h = _sha256()
+    for i in range(0, len(buf), 1 << 20):
+        h.update(buf[i:i + (1 << 20)])
+    return buf, h.hexdigest()
+
+
+@functools.lru_cache(maxsize=256)
+def _hash_and_quality_from_stat(inode, mtime_ns, size, path):
+    """Fused hash + quality computation from a single file read"""
+    meta = _read_meta(path, size)
+    if meta is not None:
+        return _sha256_file(path), _quality_from_meta(meta, size)
+    buf, digest = _load_once(path)
+    try:
+        quality = _quality_from_bytes(buf, size, path)
+    finally:
+        if isinstance(buf, mmap.mmap):
+            buf.close()
+    return digest, quality
+
+
+def _read_meta(path, size):
+    """Load {path}.meta.json if present and not stale, else None.
+
+    A sidecar whose recorded file_size disagrees with the current stat
+    is treated as stale and ignored.
+    """
+    try:
+        with open(f"{path}.meta.json", 'rb') as f:
+            meta = _json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if meta.get("file_size") != size:
+        return None
+    return meta
+
+
+def _quality_from_meta(meta, size):
+    """Quality score from sidecar metadata - no pickle access at all"""
+    n = meta.get("n_estimators")
+    if n:
+        return min(95, 70 + n // 10)
+    n = meta.get("n_coef")
+    if n:
+        return min(92, 65 + n * 2)
+    n = meta.get("n_support")
+    if n:
+        return min(90, 68 + n // 5)
+    return min(88, 60 + size // 1024)
+
+
+def build_meta(path):
+    """Write the {path}.meta.json sidecar read by the quality scorer.
+
+    Run once at model-publish time: does the full unpickle introspection
+    that attestation would otherwise repeat per run, and records the few
+    attributes the score is derived from. Returns the sidecar path.
+    """
+    meta = {"file_size": os.path.getsize(path)}
+    with open(path, 'rb') as f:
+        model = pickle.load(f)
+    meta["kind"] = type(model).__name__
+    if hasattr(model, 'n_estimators'):
+        meta["n_estimators"] = int(model.n_estimators)
+    elif hasattr(model, 'coef_'):
+        meta["n_coef"] = len(model.coef_[0])
+    elif hasattr(model, 'support_'):
+        meta["n_support"] = len(model.support_)
+    meta_path = f"{path}.meta.json"
+    with open(meta_path, 'wb') as f:
+        f.write(_json_dumps(meta, indent=True))
+    return meta_path
+
+
+def _scan_pickle_attrs(stream):
+    """Shallow pickle-opcode scan for the estimator attributes we score on.
+
+    Walks the opcode stream with pickletools.genops instead of executing it,
+    so no sklearn import, no numpy array materialization, and no arbitrary
+    code execution. Returns {'n_estimators': int} and/or marker keys for
+    'coef_' / 'support_', or None when the stream is unreadable.
+    """
+    attrs = {}
+    last_key = None
+    try:
+        for opcode, arg, _pos in pickletools.genops(stream):
+            if opcode.name in ('MEMOIZE', 'BINPUT', 'LONG_BINPUT', 'FRAME'):
+                continue  # bookkeeping opcodes between a dict key and its value
+            if opcode.name in _PICKLE_STR_OPS and arg in ('n_estimators', 'coef_', 'support_'):
+                last_key = arg
+            elif last_key == 'n_estimators':
+                if opcode.name in _PICKLE_INT_OPS:
+                    attrs['n_estimators'] = int(arg)
+                last_key = None
+            elif last_key is not None:
+                attrs.setdefault(last_key, True)
+                last_key = None
+    except Exception:
+        return None
+    return attrs
+
+
+def _quality_from_bytes(buf, size, path):
+    """Quality score from an already-loaded model buffer.
+
+    The opcode scan answers the common (tree-ensemble) case without
+    rebuilding the estimator; the unpickling introspection only runs for
+    models whose scored attribute is an array we cannot size from opcodes.
+    """
+    if hasattr(buf, 'seek'):
+        buf.seek(0)
+        attrs = _scan_pickle_attrs(buf)
+    else:
+        attrs = _scan_pickle_attrs(io.BytesIO(buf))
+    if attrs is None:
+        # Unreadable pickle stream - score from file size alone
+        return min(88, 60 + size // 1024)
+    if 'n_estimators' in attrs and not isinstance(attrs['n_estimators'], bool):
+        return min(95, 70 + attrs['n_estimators'] // 10)
+    if not attrs:
+        # No scored attribute present at all - size heuristic, no unpickle
+        return min(88, 60 + size // 1024)
+    return _quality_from_pickle(buf, path)
+
+
+@functools.lru_cache(maxsize=256)
+def _quality_from_stat(inode, mtime_ns, size, path):
+    """Standalone quality score, cached by the file's stat signature"""
+    meta = _read_meta(path, size)
+    if meta is not None:
+        return _quality_from_meta(meta, size)
+    buf = _open_buffer(path)
+    try:
+        return _quality_from_bytes(buf, size, path)
+    finally:
+        if isinstance(buf, mmap.mmap):
+            buf.close()
+
+
+def _quality_from_pickle(buf, path):
+    """Full unpickle introspection - fallback for array-valued attributes"""
+    try:
+        model = pickle.loads(buf)
+
+        if hasattr(model, 'n_estimators'):
+            return min(95, 70 + model.n_estimators // 10)
+        elif hasattr(model, 'coef_'):
+            return min(92, 65 + len(model.coef_[0]) * 2)
+        elif hasattr(model, 'support_'):
+            return min(90, 68 + len(model.support_) // 5)
+        else:
+            # Generic model - the on-disk pickle we just loaded is the same
+            # size signal re-serializing would produce, for free
+            return min(88, 60 + len(buf) // 1024)
+
+    except Exception as e:
+        logger.warning("Could not inspect model %s: %s", path, e)
+        return 75
+
+
+def _measurement_key():
+    """Everything the PCR measurements depend on; stable within a deploy"""
+    return (
+        _OS_NAME, _OS_RELEASE, _MACHINE,
+        sys.version, os.getcwd(), os.path.getmtime(__file__)
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _system_measurements_cached(key):
+    """Compute (or load) the PCR measurements once per process.
+
+    The measurements depend only on process-static state, so repeated
+    generator constructions reuse the digests. A small on-disk cache keyed
+    by the same tuple lets cold starts skip the module-code hash as well.
+    """
+    cache_key = _h(*[str(part) for part in key]).hex()
+    try:
+        with open(_PCR_CACHE_FILE, 'rb') as f:
+            cached = _json_loads(f.read())
+        if cached.get("key") == cache_key:
+            return cached["pcrs"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    pcr0 = _h("platform", key[0], key[1], key[2]).hex()
+    pcr1 = _h("python", sys.version, sys.executable).hex()
+
+    # PCR2 measures this module's own code, like a TEE measuring its image
+    pcr2 = _sha256_file(__file__)
+
+    # Fixed field order keeps the digest canonical without JSON round-trips
+    path_hash = hashlib.sha256(os.environ.get("PATH", "").encode()).hexdigest()[:16]
+    pcr8 = _h("env", os.getcwd(), os.environ.get("USER", "unknown"), path_hash).hex()
+
+    pcrs = {"pcr0": pcr0, "pcr1": pcr1, "pcr2": pcr2, "pcr8": pcr8}
+    try:
+        _PCR_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(_PCR_CACHE_FILE, 'wb') as f:
+            f.write(_json_dumps({"key": cache_key, "pcrs": pcrs}))
+    except OSError:
+        pass
+    return pcrs
+
+
+class RealAttestationGenerator:
+    """Generates attestations with real measurements in simulation mode"""
+
+    def __init__(self, system_measurements=None):
+        # All derived state is lazy (cached_property below): callers that
+        # only hash files never pay for PCR measurement or identity setup
+        self._system_measurements_override = system_measurements
+
+    @functools.cached_property
+    def simulation_id(self):
+        """Stable simulation identity for this process"""
+        return _h(_NODE_NAME, _OS_NAME, str(os.getpid())).hex()[:16]
+
+    @functools.cached_property
+    def system_measurements(self):
+        """PCR-style measurements from the real system state.
+
+        Pool workers pass the parent's measurements to __init__ so they
+        skip the module-code hash entirely.
+        """
+        if self._system_measurements_override is not None:
+            return dict(self._system_measurements_override)
+        return dict(_system_measurements_cached(_measurement_key()))
+
+    @functools.cached_property
+    def _prefix_hasher(self):
+        """PCR fields are fixed for this instance's lifetime: absorb them
+        once and clone the hasher state per attestation, leaving only the
+        varying tail to compress"""
+        m = self.system_measurements
+        h = _fast_hasher()
+        _update_fields(h, (m["pcr0"], m["pcr1"], m["pcr2"], m["pcr8"]))
+        return h
+
+    @functools.cached_property
+    def _signing_prefix(self):
+        """Same prefix as flat bytes, for backends hashing whole messages"""
+        m = self.system_measurements
+        return _pack_fields((m["pcr0"], m["pcr1"], m["pcr2"], m["pcr8"]))
+
+    @functools.cached_property
+    def _enclave_id(self):
+        """The enclave id is deterministic per process"""
+        return "sim-enclave-" + _h(
+            _NODE_NAME, _OS_NAME, _MACHINE,
+            self.simulation_id, str(os.getpid())
+        ).hex()[:24]
+
+    def compute_real_model_hash(self, model_path):
+        """SHA-256 of the actual model file contents, streamed in O(1) memory"""
+        model_hash = _hash_from_stat(*_stat_key(model_path))
+        logger.debug("Computed real hash for %s: %.16s...", model_path, model_hash)
+        return model_hash
+
+    def compute_real_quality_score(self, model_path):
+        """Derive a quality score from the real model structure"""
+        quality = _quality_from_stat(*_stat_key(model_path))
+        logger.debug("Computed real quality score for %s: %s", model_path, quality)
+        return quality
+
+    def generate_simulation_enclave_id(self):
+        """Return the deterministic enclave id for this simulation"""
+        logger.debug("Generated simulation enclave id: %s", self._enclave_id)
+        return self._enclave_id
+
+    def _attestation_digest(self, model_hash, quality_score, timestamp, enclave_id):
+        """Digest of one signing payload, on whichever backend is active.
+
+        With a multi-buffer backend installed the signing payloads are
+        SHA-256 over the flat prefix+tail encoding (so batched and scalar
+        digests agree); otherwise the cloned fast-hasher prefix path is
+        used. Like the hasher choice itself, the digest only has to be
+        consistent within a process.
+        """
+        tail = (model_hash, str(quality_score), timestamp, enclave_id)
+        if _sha256_multi_buffer is not None:
+            return hashlib.sha256(self._signing_prefix + _pack_fields(tail)).hexdigest()
+        h = self._prefix_hasher.copy()
+        _update_fields(h, tail)
+        return h.hexdigest()
+
+    def generate_simulation_attestation(self, model_hash, quality_score, timestamp, enclave_id):
+        """Bind the PCR measurements to the ML result in one attestation hash"""
+        attestation_hash = self._attestation_digest(model_hash, quality_score, timestamp, enclave_id)
+        logger.debug("Created simulation attestation: %.16s...", attestation_hash)
+        return attestation_hash
+
+    def generate_simulation_attestation_batch(self, items):
+        """Attestation hashes for many (model_hash, quality, timestamp,
+        enclave_id) tuples in one flush.
+
+        The signing payloads are independent one-block messages, so a
+        multi-buffer SHA-256 backend hashes them eight per SIMD dispatch;
+        without one, each falls back to the cloned-prefix path.
+        """
+        if _sha256_multi_buffer is None:
+            return [self._attestation_digest(*item) for item in items]
+        payloads = [self._signing_prefix + _pack_fields(
+            (model_hash, str(quality_score), timestamp, enclave_id))
+            for model_hash, quality_score, timestamp, enclave_id in items]
+        hashes = []
+        for start in range(0, len(payloads), _SHA256_BATCH_LANES):
+            hashes.extend(d.hex() for d in
+                          _sha256_multi_buffer(payloads[start:start + _SHA256_BATCH_LANES]))
+        return hashes
+
+    def generate_ml_result_hash(self, model_hash, quality_score, now_s=None):
+        """Hash binding the evaluation result to the evaluated model"""
+        if now_s is None:
+            now_s = time.time()
+        return _fast_h(model_hash, str(quality_score), str(now_s)).hex()
+
+    def verify_simulation_attestation(self, attestation_hash, model_hash, quality_score, timestamp, enclave_id):
+        """Re-derive the attestation hash with the same field order and compare"""
+        expected = self._attestation_digest(model_hash, quality_score, timestamp, enclave_id)
+        # Constant-time compare: attestation hashes may arrive from callers
+        # we don't control, and compare_digest is no slower than == here
+        return hmac.compare_digest(expected, attestation_hash)
+
+    def generate_simulation_attestation_data(self, model_path, model_hash=None):
+        """Produce the full attestation payload for one model file
+
+        Callers that batch-hashed many files up front can pass model_hash
+        to skip the per-file hashing pass.
+        """
+        if model_hash is None:
+            # Fused path: one file read serves both the hash and the
+            # quality inspection
+            model_hash, quality_score = _hash_and_quality_from_stat(*_stat_key(model_path))
+        else:
+            quality_score = self.compute_real_quality_score(model_path)
+        enclave_id = self.generate_simulation_enclave_id()
+
+        # Read the clock once per attestation; all time-derived fields come
+        # from the same instant (utcnow() is also deprecated since 3.12)
+        now_s = time.time()
+        timestamp = datetime.fromtimestamp(now_s, tz=timezone.utc).isoformat().replace('+00:00', 'Z')
+        request_id = f"req_{int(now_s * 1000)}"
+
+        attestation_hash = self.generate_simulation_attestation(
+            model_hash, quality_score, timestamp, enclave_id
+        )
+        ml_result_hash = self.generate_ml_result_hash(model_hash, quality_score, now_s=now_s)
+
+        attestation_data = {
+            "request_id": request_id,
+            "enclave_id": enclave_id,
+            "model_path": str(model_path),
+            "model_hash": model_hash,
+            "quality_score": quality_score,
+            "ml_result_hash": ml_result_hash,
+            "attestation_hash": attestation_hash,
+            "pcrs": dict(self.system_measurements),
+            "timestamp": timestamp,
+            "mode": "SIMULATION"
+        }
+
+        logger.debug("Generated SIMULATION attestation for %s", model_path)
+        return attestation_data
+
+
+# Per-worker generator, seeded by the pool initializer
+_worker_generator = None
+
+
+def _init_worker(system_measurements):
+    global _worker_generator
+    _worker_generator = RealAttestationGenerator(system_measurements=system_measurements)
+
+
+def _attest_chunk(paths):
+    """Attest one batch of model files inside a pool worker"""
+    generator = _worker_generator or RealAttestationGenerator()
+    model_hashes = _sha256_files_batch(paths)
+
+    chunk_attestations = [
+        generator.generate_simulation_attestation_data(
+            model_file, model_hash=model_hashes[model_file]
+        )
+        for model_file in paths
+    ]
+
+    # Deferred verification: re-derive every signing digest in one batch
+    # flush instead of one hash call per attestation
+    expected_hashes = generator.generate_simulation_attestation_batch([
+        (a["model_hash"], a["quality_score"], a["timestamp"], a["enclave_id"])
+        for a in chunk_attestations
+    ])
+    for attestation, expected in zip(chunk_attestations, expected_hashes):
+        attestation["verified"] = hmac.compare_digest(expected, attestation["attestation_hash"])
+    return chunk_attestations
+
+
+def main():
+    """Generate and verify attestations for every local tiny model"""
+    logging.basicConfig(level=logging.WARNING)
+    generator = RealAttestationGenerator()
+    tiny_models_dir = Path("tiny_models")
+
+    if not tiny_models_dir.exists():
+        print(f"❌ {tiny_models_dir} not found - run from the repository root")
+        return
+
+    model_files = sorted(tiny_models_dir.glob("*.pkl"))
+    chunks = [model_files[i:i + _SHA256_BATCH_LANES]
+              for i in range(0, len(model_files), _SHA256_BATCH_LANES)]
+
+    attestations = []
+    if len(chunks) > 1:
+        # Attestations are independent and CPU-bound (unpickle + hashing),
+        # so fan chunks out across processes; workers inherit the PCR
+        # measurements instead of recomputing them
+        with ProcessPoolExecutor(
+            initializer=_init_worker,
+            initargs=(generator.system_measurements,)
+        ) as executor:
+            for chunk_result in executor.map(_attest_chunk, chunks):
+                attestations.extend(chunk_result)
+    else:
+        _init_worker(generator.system_measurements)
+        for chunk in chunks:
+            attestations.extend(_attest_chunk(chunk))
+
+    with open("real_attestations.json", 'wb') as f:
+        f.write(_json_dumps(attestations, indent=True))
+
+    print("=" * 50)
+    print(f"Generated {len(attestations)} attestations "
+          f"({sum(1 for a in attestations if a['verified'])} verified)")
+    print("Results written to real_attestations.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,674 @@
+#!/usr/bin/env python3
+"""
+TEE Server for Satya Marketplace
+Simulated Trusted Execution Environment: serves attested model inference on
+port 5001 and includes the weather-oracle TEE simulation used in demos.
+"""
+
+import os
+import sys
+import json
+import base64
+import queue
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import time
+import hashlib
+import hmac
+import pickle
+import secrets
+import asyncio
+import functools
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+import numpy as np
+import uvicorn
+from fastapi import FastAPI, File, HTTPException, UploadFile
+from pydantic import BaseModel
+
+from real_attestation_generator import RealAttestationGenerator
+
+try:
+    # Optional orjson: encodes straight to bytes, ~5x faster than the
+    # stdlib, and serializes numpy arrays without intermediate lists
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+if _orjson is not None:
+    from fastapi.responses import ORJSONResponse
+    app = FastAPI(title="Satya TEE Server", version="1.0.0",
+                  default_response_class=ORJSONResponse)
+else:
+    app = FastAPI(title="Satya TEE Server", version="1.0.0")
+
+logger = logging.getLogger("tee")
+_log_listener = None
+_log_listener_pid = None
+_log_setup_lock = threading.Lock()
+
+
+def _setup_logging():
+    """Queue-backed logging: handlers format and write on a background
+    thread, so a slow stdout never blocks the event loop.
+
+    Runs once per process: uvicorn's multi-worker mode imports
+    "tee_server:app" in each worker, which never executes main() - so
+    the handler must be installed here, per process, or the "tee"
+    logger in workers has no handler and drops everything below
+    WARNING. The pid guard rebuilds the queue and listener after a
+    fork instead of trusting an inherited listener thread.
+    """
+    global _log_listener, _log_listener_pid
+    pid = os.getpid()
+    if _log_listener_pid == pid:
+        return
+    with _log_setup_lock:
+        if _log_listener_pid == pid:
+            return
+        log_queue = queue.SimpleQueue()
+        stream = logging.StreamHandler()
+        stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+        listener = QueueListener(log_queue, stream)
+        listener.start()
+        # Drop any handler inherited across fork - its queue has no
+        # listener in this process
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        logger.addHandler(QueueHandler(log_queue))
+        logger.setLevel(os.environ.get("LOG_LEVEL", "info").upper())
+        _log_listener = listener
+        _log_listener_pid = pid
+
+
+WEATHER_API_URL = "http://api.weatherapi.com/v1/current.json"
+WEATHER_API_KEY = os.environ.get("WEATHER_API_KEY", "demo")
+
+# Expected PCR values for the simulated enclave image
+EXPECTED_PCRS = {
+    "pcr0": hashlib.sha256(b"satya-sim-pcr0").hexdigest(),
+    "pcr1": hashlib.sha256(b"satya-sim-pcr1").hexdigest(),
+    "pcr2": hashlib.sha256(b"satya-sim-pcr2").hexdigest(),
+    "pcr8": hashlib.sha256(b"satya-sim-pcr8").hexdigest(),
+}
+
+# One concatenated raw-byte buffer so verification is a single
+# constant-time compare over 128 bytes instead of 256 hex characters
+EXPECTED_PCRS_CONCAT = bytes.fromhex(
+    EXPECTED_PCRS["pcr0"] + EXPECTED_PCRS["pcr1"]
+    + EXPECTED_PCRS["pcr2"] + EXPECTED_PCRS["pcr8"]
+)
+
+# Resolve verification model paths once at import: per-request dict
+# construction plus exists()/glob() syscalls added up under load
+MODEL_MAPPING = {
+    model_id: path
+    for model_id, path in {
+        "tiny_lr": Path("tiny_models/tiny_lr.pkl"),
+        "tiny_rf": Path("tiny_models/tiny_rf.pkl"),
+        "tiny_lr_underfit": Path("tiny_models/tiny_lr_underfit.pkl"),
+        "tiny_mlp": Path("tiny_models/tiny_mlp.pkl"),
+    }.items()
+    if path.exists()
+}
+FALLBACK_MODELS = sorted(Path("nautilus-production/tiny_models").glob("*.pkl"))
+
+try:
+    # Optional BLAKE3: SIMD-accelerated, several times faster than SHA-256
+    # for the short signature payloads hashed inside request handlers
+    import blake3 as _blake3
+
+    def _fast_hexdigest(data: bytes) -> str:
+        return _blake3.blake3(data).hexdigest()
+except ImportError:
+    def _fast_hexdigest(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=32).hexdigest()
+
+try:
+    import joblib as _joblib
+except ImportError:
+    _joblib = None
+
+try:
+    # Optional Numba: compiles the per-row confidence reduction into one
+    # fused pass over the probability matrix; cache=True persists the
+    # compilation on disk so server boots skip the JIT warm-up
+    import numba
+
+    @numba.njit(cache=True, fastmath=True)
+    def _row_max(p):
+        n, k = p.shape
+        out = np.empty(n, p.dtype)
+        for i in range(n):
+            mv = p[i, 0]
+            for j in range(1, k):
+                if p[i, j] > mv:
+                    mv = p[i, j]
+            out[i] = mv
+        return out
+except ImportError:
+    def _row_max(p):
+        return p.max(axis=1)
+
+
+def _json_dumps(obj, indent=False) -> bytes:
+    """Serialize to JSON bytes, via orjson when installed"""
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+MANIFEST_PATH = Path("test_manifest.json")
+
+if MANIFEST_PATH.exists():
+    with open(MANIFEST_PATH) as f:
+        TEST_MANIFEST = json.load(f)
+else:
+    TEST_MANIFEST = {
+        "models": [
+            {"id": "tiny_lr", "name": "Tiny Logistic Regression",
+             "path": "tiny_models/tiny_lr.pkl"},
+            {"id": "tiny_rf", "name": "Tiny Random Forest",
+             "path": "tiny_models/tiny_rf.pkl"},
+        ]
+    }
+
+
+# Serializes manifest mutations across concurrent uploads
+_manifest_lock = asyncio.Lock()
+
+
+def _atomic_write_manifest(manifest: Dict[str, Any]) -> None:
+    """Write the manifest via a temp file + rename so readers never see
+    a partial write"""
+    tmp_path = MANIFEST_PATH.with_suffix(".json.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(_json_dumps(manifest, indent=True))
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+class InferenceRequest(BaseModel):
+    model_id: str
+    # Small inputs: nested float lists, validated per element
+    input_data: Optional[List[List[float]]] = None
+    # Large batches: base64-encoded row-major float32 buffer + its shape.
+    # np.frombuffer skips per-element validation and re-boxing entirely
+    input_b64: Optional[str] = None
+    input_shape: Optional[List[int]] = None
+
+
+class AttestationData(BaseModel):
+    pcr0: str
+    pcr1: str
+    pcr2: str
+    pcr8: str
+    enclave_id: str
+
+
+class VerificationRequest(BaseModel):
+    model_id: str
+    attestation: Optional[AttestationData] = None
+
+
+def verify_attestation(attestation: AttestationData) -> bool:
+    """Check the reported PCR values against the expected enclave image.
+
+    All four PCRs are compared as one concatenated buffer: a single
+    constant-time compare_digest instead of four string comparisons and
+    a per-PCR status print on every request.
+    """
+    try:
+        reported = bytes.fromhex(
+            attestation.pcr0 + attestation.pcr1
+            + attestation.pcr2 + attestation.pcr8
+        )
+    except ValueError:
+        return False
+    pcrs_ok = hmac.compare_digest(reported, EXPECTED_PCRS_CONCAT)
+    logger.debug("PCR verification: %s", "ok" if pcrs_ok else "mismatch")
+    return pcrs_ok
+
+
+_model_load_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=16)
+def _load_model_cached(model_id: str):
+    """Load (model, model_info, model_hash) once per model id.
+
+    The first request pays for the disk read, unpickle and hash; every
+    later request for the same model is a dict lookup. /upload-model
+    clears the cache when the manifest changes.
+    """
+    model_info = None
+    for entry in TEST_MANIFEST["models"]:
+        if entry["id"] == model_id:
+            model_info = entry
+            break
+    if model_info is None:
+        raise HTTPException(status_code=404, detail=f"Unknown model: {model_id}")
+
+    model_path = Path(model_info["path"])
+    if not model_path.exists():
+        raise HTTPException(status_code=404, detail=f"Model file missing: {model_path}")
+
+    model = None
+    if _joblib is not None:
+        try:
+            # mmap'd load: array payloads stay on the OS page cache,
+            # shared across workers, instead of copied onto each heap
+            model = _joblib.load(model_path, mmap_mode='r')
+        except Exception:
+            model = None  # not a joblib artifact - fall back to pickle
+    if model is None:
+        with open(model_path, 'rb') as f:
+            model = pickle.load(f)
+
+    model_hash = model_info.get("hash")
+    if model_hash is None:
+        with open(model_path, 'rb') as f:
+            if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                model_hash = hashlib.file_digest(f, 'sha256').hexdigest()
+            else:
+                h = hashlib.sha256()
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    h.update(chunk)
+                model_hash = h.hexdigest()
+        model_info["hash"] = model_hash
+
+    logger.info("Loaded model %s from %s", model_id, model_path)
+    return model, model_info, model_hash
+
+
+def load_model(model_id: str):
+    """Cached model load; the lock keeps concurrent cold loads single-flight"""
+    with _model_load_lock:
+        return _load_model_cached(model_id)
+
+
+def _request_input_array(request: "InferenceRequest") -> np.ndarray:
+    """Materialize the input matrix from whichever encoding was sent"""
+    if request.input_b64 is not None:
+        if not request.input_shape:
+            raise HTTPException(status_code=400,
+                                detail="input_b64 requires input_shape")
+        buf = base64.b64decode(request.input_b64)
+        return np.frombuffer(buf, dtype=np.float32).reshape(request.input_shape)
+    if request.input_data is None:
+        raise HTTPException(status_code=400,
+                            detail="Provide input_data or input_b64")
+    return np.asarray(request.input_data)
+
+
+def _run_inference(model, request: "InferenceRequest"):
+    """CPU-bound inference path, run in a worker thread.
+
+    Input decoding happens here too, so large request payloads never
+    stall the event loop; NumPy/BLAS kernels release the GIL internally.
+    """
+    input_array = _request_input_array(request)
+    return model.predict(input_array), model.predict_proba(input_array)
+
+
+def _signature_bytes(value) -> bytes:
+    """Canonical full-fidelity bytes for one signature field.
+
+    Arrays (and the lists .tolist() produces on the stdlib-json path)
+    are hashed as dtype/shape-tagged raw bytes: str() of an ndarray
+    truncates past 1000 elements and tracks np.printoptions, so it
+    neither binds the whole prediction data nor yields a stable value
+    across encoders.
+    """
+    if isinstance(value, (np.ndarray, list, tuple)):
+        arr = np.asarray(value)
+        return b"%s:%s:%s" % (str(arr.dtype).encode(),
+                              str(arr.shape).encode(),
+                              arr.tobytes())
+    return str(value).encode()
+
+
+def create_signature(data: Dict[str, Any]) -> str:
+    """Simulated enclave signature over a fixed-schema payload.
+
+    Callers build their payload dicts with a fixed key order, so the
+    insertion-ordered k=v join is already canonical - no JSON encode and
+    no per-call key sort.
+    """
+    canonical = b"|".join(k.encode() + b"=" + _signature_bytes(data[k])
+                          for k in data)
+    return _fast_hexdigest(canonical)
+
+
+@app.get("/attestation/challenge")
+async def get_attestation_challenge():
+    """Issue a fresh nonce for attestation requests"""
+    # The nonce only needs to be unpredictable - no hash round required
+    nonce = secrets.token_hex(32)
+    return {"nonce": nonce, "timestamp": time.time()}
+
+
+@app.post("/inference")
+async def secure_inference(request: InferenceRequest):
+    """Run model inference inside the simulated TEE"""
+    # monotonic_ns for the duration (cheaper, immune to NTP jumps); one
+    # time.time() read below supplies the wall-clock timestamp
+    t0 = time.monotonic_ns()
+
+    model, model_info, model_hash = load_model(request.model_id)
+
+    predictions, probabilities = await asyncio.to_thread(
+        _run_inference, model, request
+    )
+
+    confidence_arr = _row_max(probabilities)
+    if _orjson is not None:
+        # ORJSONResponse serializes ndarrays natively (OPT_SERIALIZE_NUMPY),
+        # so skip the per-element boxing that .tolist() would do
+        predictions_out, confidence_out = predictions, confidence_arr
+    else:
+        predictions_out, confidence_out = predictions.tolist(), confidence_arr.tolist()
+    if logger.isEnabledFor(logging.DEBUG):
+        # Stringifying the whole prediction list is itself costly - only
+        # do it when debug logging is actually on
+        logger.debug("Predictions: %s", predictions_out)
+        logger.debug("Average confidence: %.4f", np.mean(confidence_arr))
+
+    inference_time = (time.monotonic_ns() - t0) / 1e6
+
+    response_data = {
+        "model_id": request.model_id,
+        "model_hash": model_hash,
+        "predictions": predictions_out,
+        "confidence_scores": confidence_out,
+        "inference_time_ms": inference_time,
+        "enclave_id": f"sim-enclave-{model_hash[:16]}",
+        "timestamp": time.time(),
+    }
+    response_data["signature"] = create_signature(response_data)
+    logger.debug("Inference complete for %s in %.1fms", request.model_id, inference_time)
+    return response_data
+
+
+@app.post("/upload-model")
+async def upload_model(model_file: UploadFile = File(...), model_id: str = ""):
+    """Register an uploaded model with the test manifest"""
+    model_id = model_id or Path(model_file.filename).stem
+
+    models_dir = Path("tiny_models")
+    models_dir.mkdir(exist_ok=True)
+    model_path = models_dir / f"{model_id}.pkl"
+
+    # Hash while writing, 64 KiB at a time: the upload never has to fit
+    # in memory as one bytes object
+    h = hashlib.sha256()
+    size = 0
+    with open(model_path, 'wb') as f:
+        while chunk := await model_file.read(1 << 16):
+            h.update(chunk)
+            f.write(chunk)
+            size += len(chunk)
+    model_hash = h.hexdigest()
+
+    async with _manifest_lock:
+        TEST_MANIFEST["models"].append({
+            "id": model_id,
+            "name": model_file.filename,
+            "path": str(model_path),
+            "hash": model_hash,
+        })
+        # Write off the event loop; the disk flush no longer stalls
+        # other in-flight requests
+        await asyncio.to_thread(_atomic_write_manifest, TEST_MANIFEST)
+    _load_model_cached.cache_clear()
+
+    logger.info("Registered model %s (%d bytes)", model_id, size)
+    return {"model_id": model_id, "model_hash": model_hash, "size": size}
+
+
+@app.post("/complete_verification")
+async def complete_verification(request: VerificationRequest):
+    """Full verification flow: resolve the model, attest it, verify PCRs"""
+    model_path = MODEL_MAPPING.get(request.model_id)
+    if model_path is None:
+        if not FALLBACK_MODELS:
+            raise HTTPException(status_code=404, detail=f"No model file for {request.model_id}")
+        model_path = FALLBACK_MODELS[0]
+
+    # One clock read + format serves both timestamp fields (utcnow() is
+    # also deprecated since 3.12)
+    now_iso = datetime.now(timezone.utc).isoformat(
+        timespec='milliseconds').replace('+00:00', 'Z')
+
+    generator = RealAttestationGenerator()
+    attestation_data = generator.generate_simulation_attestation_data(str(model_path))
+    attestation_data["timestamp"] = now_iso
+
+    pcrs_verified = True
+    if request.attestation is not None:
+        pcrs_verified = verify_attestation(request.attestation)
+
+    verification_metadata = {
+        "model_id": request.model_id,
+        "model_path": str(model_path),
+        "pcrs_verified": pcrs_verified,
+        "timestamp": now_iso,
+    }
+    verification_metadata["signature"] = create_signature(verification_metadata)
+
+    logger.debug("Completed verification for %s", request.model_id)
+    return {"attestation": attestation_data, "verification": verification_metadata}
+
+
+@app.on_event("startup")
+async def _warmup():
+    """Prime caches before the first real request lands.
+
+    Loading each manifest model pulls its pickle into the page cache and
+    populates the LRU, and a one-row dummy predict triggers sklearn's
+    lazy BLAS binding - moving the cold-start cost off the first
+    request's critical path.
+    """
+    # Startup runs in every uvicorn worker, so this is where each
+    # serving process gets its own log handler
+    _setup_logging()
+    for entry in TEST_MANIFEST["models"]:
+        try:
+            model, _info, _hash = await asyncio.to_thread(load_model, entry["id"])
+        except HTTPException:
+            continue
+        try:
+            dummy = np.zeros((1, getattr(model, "n_features_in_", 4)))
+            await asyncio.to_thread(model.predict, dummy)
+        except Exception:
+            pass
+        logger.info("Warmed model %s", entry["id"])
+
+
+class WeatherTEESimulator:
+    """Simulates the weather-oracle TEE flow end to end.
+
+    Locations are independent and the work is network-bound, so the
+    simulation fans all locations out concurrently over one shared
+    aiohttp session instead of blocking on each in turn.
+    """
+
+    # How long one accessibility probe stays valid for subsequent locations
+    PROBE_TTL_S = 30.0
+
+    def __init__(self):
+        self.tee_base_url = os.environ.get("TEE_SERVER_URL", "http://localhost:5001")
+        self.test_locations = ["London", "Tokyo", "New York", "Sydney"]
+        self.session = None
+        self._probe_result = None
+        self._probe_at = 0.0
+
+    async def __aenter__(self):
+        # Keep-alive pooling: the weather API and the two TEE endpoints
+        # share hosts across locations, so pooled connections skip the
+        # TCP/TLS handshake on every request after the first per host
+        self.session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=10),
+            connector=aiohttp.TCPConnector(limit=16, limit_per_host=4),
+            headers={"Accept": "application/json", "Connection": "keep-alive"},
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+
+    async def fetch_weather_data(self, location: str) -> Dict[str, Any]:
+        """Fetch live weather for a location, falling back to simulation"""
+        try:
+            async with self.session.get(
+                WEATHER_API_URL,
+                params={"key": WEATHER_API_KEY, "q": location},
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return {
+                        "location": location,
+                        "temperature": data["current"]["temp_c"],
+                        "condition": data["current"]["condition"]["text"],
+                        "source": "live",
+                    }
+        except (aiohttp.ClientError, asyncio.TimeoutError, KeyError):
+            pass
+        # Deterministic simulated reading so demos work offline
+        simulated_temp = 10.0 + (sum(location.encode()) % 200) / 10.0
+        return {
+            "location": location,
+            "temperature": simulated_temp,
+            "condition": "Simulated",
+            "source": "simulation",
+        }
+
+    async def _probe_endpoint(self, endpoint: str) -> bool:
+        """Lightweight liveness probe: HEAD with tight connect/read limits"""
+        try:
+            async with self.session.head(
+                endpoint,
+                timeout=aiohttp.ClientTimeout(sock_connect=1.0, sock_read=2.0),
+            ) as response:
+                return response.status == 200
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return False
+
+    async def test_tee_endpoint_accessibility(self) -> bool:
+        """Probe the TEE endpoints; any success means reachable.
+
+        The first endpoint to answer decides - remaining probes are
+        cancelled - and the verdict is cached for PROBE_TTL_S so every
+        location in a run shares one probe instead of re-testing.
+        """
+        if (self._probe_result is not None
+                and time.monotonic() - self._probe_at < self.PROBE_TTL_S):
+            return self._probe_result
+
+        endpoints_to_test = [
+            f"{self.tee_base_url}/attestation/challenge",
+            f"{self.tee_base_url}/docs",
+        ]
+        pending = {asyncio.create_task(self._probe_endpoint(endpoint))
+                   for endpoint in endpoints_to_test}
+        accessible = False
+        while pending and not accessible:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            accessible = any(task.result() for task in done)
+        for task in pending:
+            task.cancel()
+
+        self._probe_result = accessible
+        self._probe_at = time.monotonic()
+        return accessible
+
+    def simulate_tee_signing(self, weather_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Sign a weather reading the way the enclave would"""
+        timestamp_ms = int(time.time() * 1000)
+        location = weather_data["location"]
+        temperature = weather_data["temperature"]
+        # Fixed three-field schema: hash the fields directly instead of
+        # building a dict and JSON-encoding it with sorted keys
+        signature = _fast_hexdigest(f"{location}|{temperature}|{timestamp_ms}".encode())
+        payload = {
+            "location": location,
+            "temperature": temperature,
+            "timestamp": timestamp_ms,
+        }
+        return {"payload": payload, "signature": signature}
+
+    def simulate_sui_transaction(self, location: str, temperature: float) -> Dict[str, Any]:
+        """Simulate minting the signed reading as a Sui object"""
+        timestamp_ms = int(time.time() * 1000)
+        # Encode each component once and share the location+temperature
+        # prefix between both digests instead of two f-string interpolations
+        loc_b = location.encode()
+        temp_b = str(temperature).encode()
+        txn_hash = _fast_hexdigest(loc_b + temp_b + str(timestamp_ms).encode())
+        nft_id = _fast_hexdigest(b"nft" + loc_b + temp_b)[:32]
+        return {
+            "transaction_hash": txn_hash,
+            "nft_id": f"0x{nft_id}",
+            "timestamp": timestamp_ms,
+        }
+
+    async def run_complete_simulation(self, location: str) -> Dict[str, Any]:
+        """Run the full fetch -> sign -> mint flow for one location"""
+        print(f"🌍 Running TEE simulation for {location}")
+        weather_data = await self.fetch_weather_data(location)
+        tee_accessible = await self.test_tee_endpoint_accessibility()
+        signed = self.simulate_tee_signing(weather_data)
+        transaction = self.simulate_sui_transaction(location, weather_data["temperature"])
+        print(f"✅ {location}: {weather_data['temperature']}°C "
+              f"({weather_data['source']}), tee_accessible={tee_accessible}")
+        return {
+            "location": location,
+            "weather": weather_data,
+            "tee_accessible": tee_accessible,
+            "signed_payload": signed,
+            "sui_transaction": transaction,
+        }
+
+
+async def run_weather_simulation():
+    """Simulate every test location concurrently over one session"""
+    async with WeatherTEESimulator() as simulator:
+        results = await asyncio.gather(
+            *[simulator.run_complete_simulation(location)
+              for location in simulator.test_locations]
+        )
+    print("=" * 50)
+    print(f"Completed {len(results)} location simulations")
+    return results
+
+
+def main():
+    if "--simulate" in sys.argv:
+        asyncio.run(run_weather_simulation())
+    else:
+        _setup_logging()
+        try:
+            # libuv event loop + C HTTP parser: drop-in wins when installed
+            import uvloop  # noqa: F401
+            import httptools  # noqa: F401
+            loop_impl, http_impl = "uvloop", "httptools"
+        except ImportError:
+            loop_impl, http_impl = "auto", "auto"
+        uvicorn.run(
+            "tee_server:app",
+            host="0.0.0.0",
+            port=int(os.environ.get("PORT", 5001)),
+            loop=loop_impl,
+            http=http_impl,
+            workers=int(os.environ.get("WEB_CONCURRENCY", os.cpu_count())),
+            log_level=os.environ.get("LOG_LEVEL", "warning").lower(),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,8 +7,24 @@ Tests all endpoints and displays results
 import requests
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 
+# One keep-alive session shared by every check instead of a fresh
+# connection per request
+SESSION = requests.Session()
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def parse_response(response) -> Dict[str, Any]:
+    """Parse a response body, through orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 # ANSI color codes
 GREEN = '\033[0;32m'
 RED = '\033[0;31m'
@@ -36,9 +52,9 @@ def test_health() -> bool:
     """Test health endpoint"""
     print_header("1️⃣  Health Check")
     try:
-        response = requests.get(f"{BASE_URL}/health", timeout=5)
+        response = SESSION.get(f"{BASE_URL}/health", timeout=5)
         response.raise_for_status()
-        data = response.json()
+        data = parse_response(response)
 
         print(json.dumps(data, indent=2))
 
@@ -58,9 +74,9 @@ def test_list_models() -> bool:
     """Test listing models"""
     print_header("2️⃣  List Test Models")
     try:
-        response = requests.get(f"{BASE_URL}/test_models", timeout=5)
+        response = SESSION.get(f"{BASE_URL}/test_models", timeout=5)
         response.raise_for_status()
-        data = response.json()
+        data = parse_response(response)
 
         print(f"Available Models: {len(data.get('models', []))}")
         for model in data.get('models', []):
@@ -84,9 +100,9 @@ def test_evaluate_model(model_name: str, dataset_name: str, expected_range: tupl
         url = f"{BASE_URL}/test_evaluate/{model_name}/{dataset_name}"
         print_info(f"Request: GET /test_evaluate/{model_name}/{dataset_name}")
 
-        response = requests.get(url, timeout=30)
+        response = SESSION.get(url, timeout=30)
         response.raise_for_status()
-        data = response.json()
+        data = parse_response(response)
 
         if not data.get('success'):
             print_error(f"Evaluation failed: {data.get('error', 'Unknown error')}")
@@ -146,14 +162,14 @@ def test_post_evaluate() -> bool:
         print_info("Sending POST request with JSON payload...")
         print(f"Payload: {json.dumps(payload, indent=2)}")
 
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/evaluate",
             json=payload,
             headers={"Content-Type": "application/json"},
             timeout=30
         )
         response.raise_for_status()
-        data = response.json()
+        data = parse_response(response)
 
         if data.get('success'):
             quality_score = data.get('evaluation', {}).get('quality_score', 0)
@@ -191,15 +207,22 @@ def main():
         ("neural_network_model.pkl", "neural_network_test.csv", (85, 90))
     ]
 
+    # The evaluations are independent; run them concurrently so the
+    # harness waits on the slowest case instead of the sum of all four
     results = []
-    for model, dataset, expected_range in tests:
-        result = test_evaluate_model(model, dataset, expected_range)
-        if result:
-            results.append({
-                'model': model,
-                'score': result.get('quality_score', 0),
-                'expected': expected_range
-            })
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = [
+            executor.submit(test_evaluate_model, model, dataset, expected_range)
+            for model, dataset, expected_range in tests
+        ]
+        for (model, dataset, expected_range), future in zip(tests, futures):
+            result = future.result()
+            if result:
+                results.append({
+                    'model': model,
+                    'score': result.get('quality_score', 0),
+                    'expected': expected_range
+                })
 
     # Test 4: POST endpoint
     test_post_evaluate()
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Tiny Models Server for Satya Marketplace
+Serves the bundled tiny sklearn models on port 8001 for local demos.
+"""
+
+import os
+import asyncio
+import concurrent.futures
+from pathlib import Path
+from typing import Any, Dict, List
+
+import joblib
+import numpy as np
+import uvicorn
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+
+try:
+    # Optional orjson: bytes-direct encoding, several times faster than
+    # the stdlib, and serializes numpy arrays without intermediate lists
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+if _orjson is not None:
+    from fastapi.responses import ORJSONResponse
+    app = FastAPI(title="Satya Tiny Models Server", version="1.0.0",
+                  default_response_class=ORJSONResponse)
+else:
+    app = FastAPI(title="Satya Tiny Models Server", version="1.0.0")
+
+TINY_MODELS_DIR = Path("tiny_models")
+
+
+class TinyModel(BaseModel):
+    id: str
+    name: str
+    model_type: str
+    file: str
+    feature_names: List[str]
+    size_bytes: int
+
+
+class TinyModelsResponse(BaseModel):
+    models: List[TinyModel]
+    count: int
+
+
+class InferenceRequest(BaseModel):
+    inputs: List[List[float]]
+
+
+# Shared feature-name lists - built once instead of per model spec
+_FEATURE_NAMES_10 = [f"feature_{i}" for i in range(10)]
+_FEATURE_NAMES_15 = [f"feature_{i}" for i in range(15)]
+
+
+def _scan_models() -> Dict[str, TinyModel]:
+    """Build the model metadata index from disk - called once at import.
+
+    Re-scanning per request cost three exists()/stat() syscalls plus full
+    Pydantic validation on every /models, /model/{id} and /inference call.
+    """
+    specs = [
+        ("tiny_lr", "Tiny Logistic Regression", "logistic_regression",
+         _FEATURE_NAMES_10),
+        ("tiny_rf", "Tiny Random Forest", "random_forest",
+         _FEATURE_NAMES_10),
+        ("tiny_mlp", "Tiny Neural Network", "neural_network",
+         _FEATURE_NAMES_15),
+        ("tiny_lr_underfit", "Tiny Underfit Logistic Regression", "logistic_regression",
+         _FEATURE_NAMES_10),
+    ]
+    models = {}
+    for model_id, name, model_type, feature_names in specs:
+        model_path = TINY_MODELS_DIR / f"{model_id}.pkl"
+        if not model_path.exists():
+            continue
+        models[model_id] = TinyModel(
+            id=model_id,
+            name=name,
+            model_type=model_type,
+            file=str(model_path),
+            feature_names=feature_names,
+            size_bytes=model_path.stat().st_size,
+        )
+    return models
+
+
+# Metadata indexed once at import; estimators cached lazily on first use
+_MODELS: Dict[str, TinyModel] = _scan_models()
+_LOADED: Dict[str, Any] = {}
+_LOAD_LOCKS: Dict[str, asyncio.Lock] = {model_id: asyncio.Lock() for model_id in _MODELS}
+
+# The /models payload never changes after import - validate it once and
+# hand out the same response object
+_MODELS_RESPONSE = TinyModelsResponse(models=list(_MODELS.values()), count=len(_MODELS))
+
+
+# CPU-bound sklearn/joblib work runs here, off the event loop thread;
+# NumPy/BLAS kernels release the GIL so worker threads overlap
+_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+def _infer_sync(model, batch: np.ndarray):
+    return model.predict(batch), model.predict_proba(batch)
+
+
+async def _load_model(model_id: str):
+    """Return the loaded estimator, unpickling at most once per model.
+
+    The per-id lock keeps concurrent cold requests from racing into
+    duplicate joblib.load calls.
+    """
+    loaded = _LOADED.get(model_id)
+    if loaded is None:
+        async with _LOAD_LOCKS[model_id]:
+            loaded = _LOADED.get(model_id)
+            if loaded is None:
+                loaded = await asyncio.get_running_loop().run_in_executor(
+                    _POOL, joblib.load, _MODELS[model_id].file
+                )
+                _LOADED[model_id] = loaded
+    return loaded
+
+
+@app.on_event("startup")
+async def _preload_models():
+    """Load every known model before traffic arrives.
+
+    The tiny pickles load in milliseconds, but that still dominates
+    actual inference time - absorbing it at startup keeps disk I/O and
+    unpickling off the request path entirely. Each uvicorn worker
+    preloads its own copies.
+    """
+    for model_id in _MODELS:
+        await _load_model(model_id)
+
+
+class AdaptiveBatcher:
+    """Coalesces concurrent inference requests for one model.
+
+    Each request enqueues its input block and awaits a future; a drain
+    task collects blocks until the batch is full or the latency window
+    closes, runs a single stacked predict/predict_proba, and scatters
+    the result slices back. N small sklearn calls become one BLAS-sized
+    call under concurrent load, while a lone request still proceeds
+    after at most the latency window.
+    """
+
+    def __init__(self, model_id: str, max_batch_size: int = 64,
+                 max_latency_ms: float = 10.0):
+        self.model_id = model_id
+        self.max_batch_size = max_batch_size
+        self.max_latency_s = max_latency_ms / 1000.0
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._drain_task = None
+
+    async def submit(self, block: np.ndarray):
+        """Queue one request's inputs; resolves to (predictions, probabilities)"""
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((block, future))
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain())
+        return await future
+
+    async def _drain(self):
+        loop = asyncio.get_running_loop()
+        while not self.queue.empty():
+            blocks, futures = [], []
+            block, future = await self.queue.get()
+            blocks.append(block)
+            futures.append(future)
+            rows = len(block)
+
+            deadline = loop.time() + self.max_latency_s
+            while rows < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    block, future = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                blocks.append(block)
+                futures.append(future)
+                rows += len(block)
+
+            try:
+                model = await _load_model(self.model_id)
+                # A lone request's block is already the batch - don't copy it
+                batch = blocks[0] if len(blocks) == 1 else np.vstack(blocks)
+                predictions, probabilities = await loop.run_in_executor(
+                    _POOL, _infer_sync, model, batch
+                )
+            except Exception as exc:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            start = 0
+            for block, future in zip(blocks, futures):
+                end = start + len(block)
+                if not future.done():
+                    future.set_result((predictions[start:end], probabilities[start:end]))
+                start = end
+
+
+_BATCHERS: Dict[str, AdaptiveBatcher] = {}
+
+
+@app.get("/models")
+async def get_tiny_models() -> TinyModelsResponse:
+    """List the available tiny models"""
+    return _MODELS_RESPONSE
+
+
+@app.get("/model/{model_id}")
+async def get_model_info(model_id: str):
+    """Metadata for a single model"""
+    model = _MODELS.get(model_id)
+    if model is None:
+        return {"error": f"Model {model_id} not found"}
+    return model
+
+
+@app.post("/inference/{model_id}")
+async def run_inference(model_id: str, request: InferenceRequest):
+    """Run a batch of inputs through one of the tiny models"""
+    target_model = _MODELS.get(model_id)
+    if target_model is None:
+        raise HTTPException(status_code=404, detail=f"Model {model_id} not found")
+
+    # Validate the block before it joins a shared batch: one ragged or
+    # wrong-width request would otherwise fail the stacked predict and
+    # fan its error out to every co-batched caller
+    try:
+        arr = np.asarray(request.inputs, dtype=np.float64)
+    except ValueError:
+        raise HTTPException(status_code=400,
+                            detail="inputs must be a rectangular 2D array")
+    expected = len(target_model.feature_names)
+    if arr.ndim != 2 or arr.shape[0] == 0 or arr.shape[1] != expected:
+        raise HTTPException(status_code=400,
+                            detail=f"inputs must have shape (n, {expected})")
+
+    batcher = _BATCHERS.get(model_id)
+    if batcher is None:
+        batcher = _BATCHERS.setdefault(model_id, AdaptiveBatcher(model_id))
+    predictions, probabilities = await batcher.submit(arr)
+    # One SIMD reduction over the probability matrix instead of a Python
+    # max() per row
+    confidence_scores = probabilities.max(axis=1)
+
+    if _orjson is not None:
+        # ORJSONResponse serializes ndarrays natively (OPT_SERIALIZE_NUMPY),
+        # so the arrays can go out without .tolist() boxing each element
+        return {
+            "model_id": model_id,
+            "predictions": predictions,
+            "probabilities": probabilities,
+            "confidence_scores": confidence_scores,
+        }
+    return {
+        "model_id": model_id,
+        "predictions": predictions.tolist(),
+        "probabilities": probabilities.tolist(),
+        "confidence_scores": confidence_scores.tolist(),
+    }
+
+
+@app.get("/health")
+async def health():
+    return {"status": "ok", "models_available": len(_MODELS)}
+
+
+if __name__ == "__main__":
+    # Separate worker processes - sklearn inference is CPU-bound, so one
+    # uvicorn process would cap throughput at a single core
+    uvicorn.run(
+        "tiny_models_server:app",
+        host="0.0.0.0",
+        port=int(os.environ.get("PORT", 8001)),
+        workers=int(os.environ.get("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1)),
+    )